@@ -1,30 +1,98 @@
-import tomli
-import os
-from typing import List
-
-CONFIG_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'config.toml') # Assumes config.toml is in the parent directory of this file's directory
-
-_config = None
-
-def _load_config():
-    """Loads the configuration from config.toml if not already loaded."""
-    global _config
-    if _config is None:
-        try:
-            with open(CONFIG_FILE_PATH, "rb") as f:
-                _config = tomli.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Configuration file not found at {CONFIG_FILE_PATH}")
-        except tomli.TOMLDecodeError:
-            raise ValueError(f"Error decoding TOML from {CONFIG_FILE_PATH}")
+import functools
+import logging
+import pathlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+try:
+    import tomllib # Python 3.11+ ships the tomli parser in the stdlib
+except ImportError:
+    import tomli as tomllib
+
+CONFIG_FILE_PATH = pathlib.Path(__file__).resolve().parent.parent / 'config.toml' # Assumes config.toml is in the parent directory of this file's directory
+
+logger = logging.getLogger(__name__)
+
+VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@dataclass
+class _ConfigCache:
+    """Resolved config values, populated once when config.toml is first loaded."""
+    __slots__ = ("webhook_url", "identities", "rpc_urls", "log_level", "rpc_max_retries", "rpc_retry_delay")
+
+    webhook_url: Optional[str] # None if [discord].webhook_url is missing
+    identities: Dict[str, str] # Keyed by cluster, e.g. {"um": "...", "ut": "..."}
+    rpc_urls: Dict[str, Tuple[str, ...]] # Keyed by cluster
+    log_level: str
+    rpc_max_retries: int
+    rpc_retry_delay: int
+
+
+def _int_setting(section: dict, key: str, default: int) -> int:
+    """
+    Reads an integer setting, falling back to the default if it can't be converted.
+    Runs once at load time, so an invalid value is only warned about once.
+    """
+    value = section.get(key, default)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid {key} {value!r} in config.toml. Defaulting to {default}.")
+        return default
+
+def _build_cache(raw: dict) -> _ConfigCache:
+    """Resolves every value the getters need from the raw TOML dict."""
+    identities = {
+        key[len("identity_"):]: value
+        for key, value in raw.get("validator", {}).items()
+        if key.startswith("identity_")
+    }
+    rpc_urls = {
+        key[len("urls_"):]: tuple(value)
+        for key, value in raw.get("rpc_urls", {}).items()
+        if key.startswith("urls_")
+    }
+
+    log_level = str(raw.get("logging", {}).get("log_level", "INFO")).upper()
+    if log_level not in VALID_LOG_LEVELS:
+        # Logging isn't configured yet at this point; warnings go to stderr via logging's last-resort handler.
+        logger.warning(f"Invalid log_level '{log_level}' in config.toml. Defaulting to INFO.")
+        log_level = "INFO"
+
+    discord = raw.get("discord", {})
+    rpc_settings = raw.get("rpc_settings", {})
+
+    return _ConfigCache(
+        webhook_url=discord.get("webhook_url"),
+        identities=identities,
+        rpc_urls=rpc_urls,
+        log_level=log_level,
+        rpc_max_retries=_int_setting(rpc_settings, "rpc_max_retries", 1), # Default to 1 retry pass
+        rpc_retry_delay=_int_setting(rpc_settings, "rpc_retry_delay_seconds", 5), # Default to 5 seconds
+    )
+
+@functools.lru_cache(maxsize=None)
+def _get_config() -> _ConfigCache:
+    """
+    Loads and resolves the configuration from config.toml.
+    The result is cached, so the file is only read on the first call. Failures are not cached.
+    """
+    try:
+        with CONFIG_FILE_PATH.open("rb") as f:
+            raw = tomllib.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found at {CONFIG_FILE_PATH}")
+    except tomllib.TOMLDecodeError:
+        raise ValueError(f"Error decoding TOML from {CONFIG_FILE_PATH}")
+    return _build_cache(raw)
 
 def get_discord_webhook_url() -> str:
     """Returns the Discord webhook URL from the config."""
-    _load_config()
-    try:
-        return _config["discord"]["webhook_url"]
-    except KeyError:
+    webhook_url = _get_config().webhook_url
+    if webhook_url is None:
         raise KeyError("Discord webhook URL not found in config.toml under [discord].webhook_url")
+    return webhook_url
 
 def get_validator_identity(cluster: str) -> str:
     """
@@ -34,64 +102,35 @@ def get_validator_identity(cluster: str) -> str:
     Returns:
         str: The validator identity public key.
     """
-    _load_config()
-    key = f"identity_{cluster}"
     try:
-        return _config["validator"][key]
+        return _get_config().identities[cluster]
     except KeyError:
-        raise KeyError(f"Validator identity for cluster '{cluster}' not found in config.toml under [validator].{key}")
+        raise KeyError(f"Validator identity for cluster '{cluster}' not found in config.toml under [validator].identity_{cluster}")
 
-def get_rpc_urls(cluster: str) -> List[str]:
+def get_rpc_urls(cluster: str) -> Tuple[str, ...]:
     """
-    Returns the list of RPC URLs for the specified cluster.
+    Returns the RPC URLs for the specified cluster.
     Args:
         cluster (str): The cluster identifier (e.g., "um" for mainnet, "ut" for testnet).
     Returns:
-        List[str]: A list of RPC URLs.
+        Tuple[str, ...]: The RPC URLs, in the order they should be tried.
     """
-    _load_config()
-    key = f"urls_{cluster}"
     try:
-        return _config["rpc_urls"][key]
+        return _get_config().rpc_urls[cluster]
     except KeyError:
-        raise KeyError(f"RPC URLs for cluster '{cluster}' not found in config.toml under [rpc_urls].{key}")
+        raise KeyError(f"RPC URLs for cluster '{cluster}' not found in config.toml under [rpc_urls].urls_{cluster}")
 
 def get_log_level() -> str:
     """Returns the desired logging level from the config, defaulting to INFO."""
-    _load_config()
-    try:
-        level = _config.get("logging", {}).get("log_level", "INFO").upper()
-        # Validate the level string
-        if level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            # Log a warning or raise an error, for now, default to INFO
-            # This part might need a logger instance if we want to log from here, 
-            # but config is loaded before logger might be fully set up by main.
-            # print(f"Warning: Invalid log_level '{level}' in config.toml. Defaulting to INFO.")
-            return "INFO"
-        return level
-    except Exception: # Catch any other unexpected error during config access
-        # print(f"Warning: Could not read log_level from config.toml. Defaulting to INFO.")
-        return "INFO"
+    return _get_config().log_level
 
 def get_rpc_max_retries() -> int:
     """Returns the maximum number of RPC retry passes, defaulting to 1."""
-    _load_config()
-    try:
-        retries = _config.get("rpc_settings", {}).get("rpc_max_retries", 1) # Default to 1 retry pass
-        return int(retries)
-    except ValueError:
-        # print("Warning: Invalid rpc_max_retries in config.toml. Defaulting to 1.")
-        return 1 # Default if conversion fails
+    return _get_config().rpc_max_retries
 
 def get_rpc_retry_delay() -> int:
     """Returns the RPC retry delay in seconds, defaulting to 5."""
-    _load_config()
-    try:
-        delay = _config.get("rpc_settings", {}).get("rpc_retry_delay_seconds", 5) # Default to 5 seconds
-        return int(delay)
-    except ValueError:
-        # print("Warning: Invalid rpc_retry_delay_seconds in config.toml. Defaulting to 5.")
-        return 5 # Default if conversion fails
+    return _get_config().rpc_retry_delay
 
 if __name__ == '__main__':
     # Example usage:
@@ -102,4 +141,4 @@ if __name__ == '__main__':
     print(f"Testnet RPC URLs: {get_rpc_urls('ut')}")
     print(f"Configured Log Level: {get_log_level()}")
     print(f"RPC Max Retries: {get_rpc_max_retries()}")
-    print(f"RPC Retry Delay (seconds): {get_rpc_retry_delay()}") 
\ No newline at end of file
+    print(f"RPC Retry Delay (seconds): {get_rpc_retry_delay()}") # Make python package
@@ -1,129 +1,330 @@
 import requests
 import subprocess
+import bisect
 import json
 import time
+import random
+import email.utils
 import logging
-from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from requests.adapters import HTTPAdapter
 
 # Assuming config.py and discord.py are in the same package/directory or accessible via PYTHONPATH
 from .config import get_rpc_urls, get_validator_identity, get_rpc_max_retries, get_rpc_retry_delay
-#from .discord import format_and_send_status
-from .discord import format_and_send_status
+from .discord import DiscordClient, get_discord_client
+from .json_utils import dumps, loads
+from .report import ValidatorReport
 
 logger = logging.getLogger(__name__)
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
+# Validator info is published as a Config program account whose key list starts with
+# VALIDATOR_INFO_KEY, followed by the validator identity (as signer). The account data begins with
+# a 1-byte key count and then (32-byte pubkey, 1-byte signer flag) pairs, so the identity starts at byte 34.
+CONFIG_PROGRAM_ID = "Config1111111111111111111111111111111111111"
+VALIDATOR_INFO_KEY = "Va1idator1nfo111111111111111111111111111111"
+_VALIDATOR_INFO_IDENTITY_OFFSET = 34
+
+MAX_BACKOFF_S = 30 # Upper bound on the sleep between RPC retry passes
+MAX_QUARANTINE_S = 300 # Upper bound on how long a failing RPC URL is skipped
+
+# Long-lived worker pool for overlapping independent RPC/CLI calls. Shared across
+# process_validator_data calls (and clusters) so threads are started once per process.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fetch-")
+
+def _build_rpc_session() -> requests.Session:
+    """
+    Creates a session whose keep-alive connections are reused across RPC calls, so the
+    TCP+TLS handshake to each RPC URL is paid once per process rather than once per call.
+    urllib3 retries are disabled; _post_with_failover owns retry and failover.
+    """
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+_SESSION = _build_rpc_session()
+
+# The JSON-RPC envelope is the same for every call, so it is kept pre-encoded and only the id,
+# method and params are spliced in. Method names are plain ASCII identifiers and need no escaping.
+_RPC_ENVELOPE = b'{"jsonrpc":"2.0","id":%d,"method":"%s","params":%s}'
+
+def _rpc_envelope(call_id: int, method: str, params: Optional[List[Any]]) -> bytes:
+    """Encodes one JSON-RPC call as UTF-8 JSON bytes."""
+    return _RPC_ENVELOPE % (call_id, method.encode(), dumps(params or []))
+
+# Per-URL health: url -> (consecutive transport failures, time.monotonic() until which the URL is skipped).
+# Lets a dead endpoint cost one timeout per quarantine window instead of one per call.
+_url_state: Dict[str, Tuple[int, float]] = {}
+_url_state_lock = threading.Lock()
+
+def _urls_to_try(cluster_rpc_urls: Sequence[str]) -> List[str]:
+    """Returns the URLs that aren't quarantined, in order, or all of them if every URL is quarantined."""
+    now = time.monotonic()
+    with _url_state_lock:
+        healthy = [url for url in cluster_rpc_urls if _url_state.get(url, (0, 0.0))[1] <= now]
+    if len(healthy) < len(cluster_rpc_urls) and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Skipping quarantined RPC URLs: %s", [url for url in cluster_rpc_urls if url not in healthy])
+    return healthy or list(cluster_rpc_urls)
+
+def _record_url_success(rpc_url: str) -> None:
+    with _url_state_lock:
+        _url_state.pop(rpc_url, None)
+
+def _record_url_failure(rpc_url: str) -> None:
+    with _url_state_lock:
+        failures = _url_state.get(rpc_url, (0, 0.0))[0] + 1
+        # Exponential quarantine with jitter, so several bots don't all retry a recovering URL at once.
+        quarantine_seconds = min(MAX_QUARANTINE_S, 2 ** failures) * random.uniform(0.5, 1.0)
+        _url_state[rpc_url] = (failures, time.monotonic() + quarantine_seconds)
+    logger.debug("Quarantining RPC URL %s for %.1fs after %d consecutive failure(s).", rpc_url, quarantine_seconds, failures)
+
+# Responses meaning an RPC endpoint is overloaded (rate limited or unavailable)
+_OVERLOAD_STATUS_CODES = (429, 503)
+RPC_TIMEOUT = (3.05, 20) # (connect, read) seconds: give up quickly on unreachable URLs, allow slow large responses
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Returns the delay requested by a Retry-After header (delta-seconds or HTTP-date), or None if absent/invalid."""
+    retry_after = response.headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
 # --- RPC and CLI Call Functions ---
 
-def _make_rpc_request(
-    cluster_rpc_urls: List[str],
-    method: str,
-    params: Optional[List[Any]] = None,
+def _post_with_failover(
+    cluster_rpc_urls: Sequence[str],
+    body: bytes,
+    label: str,
+    extract: Callable[[Any, str], Any],
     max_retries_override: Optional[int] = None,
     retry_delay_override: Optional[int] = None
-) -> Dict[str, Any]:
+) -> Any:
     """
-    Helper function to make a JSON-RPC request, iterating through URLs and retrying on failure.
+    Posts an encoded JSON-RPC request, iterating through URLs and retrying on failure.
+    URLs quarantined after recent transport failures are skipped while any other URL is available.
 
     Args:
-        cluster_rpc_urls: A list of RPC URLs for the target cluster.
-        method: The RPC method name.
-        params: Optional list of parameters for the RPC method.
+        cluster_rpc_urls: The RPC URLs for the target cluster, in the order they should be tried.
+        body: The encoded JSON-RPC request (see _rpc_envelope), or a JSON array of them for a batch.
+            It is sent as-is to every URL and on every retry pass.
+        label: Describes the call in log and error messages, e.g. "method 'getEpochInfo'".
+        extract: Called with the decoded response body and the URL it came from. Returns the value
+            to hand back, or raises RuntimeError to treat the response as a failure of that URL.
         max_retries_override: Optional override for max_retries from config.
         retry_delay_override: Optional override for retry_delay from config.
 
     Returns:
-        The 'result' field from the JSON-RPC response.
+        Whatever extract returned for the first successful response.
 
     Raises:
         RuntimeError: If the request fails for all URLs after all retry attempts.
     """
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params or []
-    }
-    headers = {"Content-Type": "application/json"}
-
     max_attempts = (max_retries_override if max_retries_override is not None else get_rpc_max_retries()) + 1
     delay_seconds = retry_delay_override if retry_delay_override is not None else get_rpc_retry_delay()
 
     last_exception_per_url = {}
 
     for attempt in range(max_attempts):
-        logger.debug(f"RPC call attempt {attempt + 1}/{max_attempts} for method '{method}'.")
-        for rpc_url in cluster_rpc_urls:
-            logger.debug(f"Attempting RPC method '{method}' on URL: {rpc_url}")
+        logger.debug("RPC call attempt %d/%d for %s.", attempt + 1, max_attempts, label)
+        retry_after_seconds = None # Shortest Retry-After any URL sent back during this pass
+        for rpc_url in _urls_to_try(cluster_rpc_urls):
+            logger.debug("Attempting RPC %s on URL: %s", label, rpc_url)
             try:
-                response = requests.post(rpc_url, json=payload, headers=headers, timeout=20)
+                response = _SESSION.post(rpc_url, data=body, timeout=RPC_TIMEOUT) # Content-Type is a session header
                 response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
-                result_json = response.json()
-                if "error" in result_json:
-                    err_msg = f"RPC error for method {method} on {rpc_url}: {result_json['error']}"
-                    logger.warning(err_msg)
-                    last_exception_per_url[rpc_url] = RuntimeError(err_msg)
+                result_json = loads(response.content)
+                _record_url_success(rpc_url) # The endpoint answered; RPC-level errors below don't count against it
+                try:
+                    result = extract(result_json, rpc_url)
+                except RuntimeError as e:
+                    logger.warning(str(e))
+                    last_exception_per_url[rpc_url] = e
                 else:
-                    logger.debug(f"Successfully fetched data for method '{method}' from {rpc_url}.")
-                    return result_json.get("result")
+                    logger.debug("Successfully fetched data for %s from %s.", label, rpc_url)
+                    return result
             except requests.exceptions.Timeout as e:
-                warn_msg = f"RPC request timeout for method {method} on {rpc_url}."
+                warn_msg = f"RPC request timeout for {label} on {rpc_url}."
                 logger.warning(warn_msg)
                 last_exception_per_url[rpc_url] = e
+                _record_url_failure(rpc_url)
             except requests.exceptions.HTTPError as e:
-                warn_msg = f"HTTP error for method {method} on {rpc_url}: {e.response.status_code} {e.response.reason}."
+                warn_msg = f"HTTP error for {label} on {rpc_url}: {e.response.status_code} {e.response.reason}."
                 logger.warning(warn_msg)
                 last_exception_per_url[rpc_url] = e
+                _record_url_failure(rpc_url)
+                if e.response.status_code in _OVERLOAD_STATUS_CODES:
+                    requested_delay = _retry_after_seconds(e.response)
+                    if requested_delay is not None and (retry_after_seconds is None or requested_delay < retry_after_seconds):
+                        retry_after_seconds = requested_delay
             except requests.exceptions.RequestException as e:
-                warn_msg = f"RPC request failed for method {method} on {rpc_url}: {e}"
+                warn_msg = f"RPC request failed for {label} on {rpc_url}: {e}"
                 logger.warning(warn_msg)
                 last_exception_per_url[rpc_url] = e
+                _record_url_failure(rpc_url)
             except json.JSONDecodeError as e:
-                warn_msg = f"Failed to decode JSON response for method {method} on {rpc_url}: {e}"
+                warn_msg = f"Failed to decode JSON response for {label} on {rpc_url}: {e}"
                 logger.warning(warn_msg)
                 last_exception_per_url[rpc_url] = e
+                _record_url_failure(rpc_url)
 
         if attempt < max_attempts - 1:
+            # Exponential backoff with full jitter: the configured delay doubles per pass (capped),
+            # and the actual sleep is drawn uniformly below it so retries from several bots spread out.
+            # If an overloaded endpoint said when to come back (Retry-After), wait that long instead.
+            if retry_after_seconds is not None:
+                backoff_seconds = min(MAX_BACKOFF_S, retry_after_seconds)
+            else:
+                backoff_seconds = random.uniform(0, min(MAX_BACKOFF_S, delay_seconds * (2 ** attempt)))
             logger.warning(
-                f"All RPC URLs failed for method '{method}' on attempt {attempt + 1}. "
-                f"Waiting {delay_seconds}s before next attempt."
+                f"All RPC URLs failed for {label} on attempt {attempt + 1}. "
+                f"Waiting {backoff_seconds:.1f}s before next attempt."
             )
-            time.sleep(delay_seconds)
+            time.sleep(backoff_seconds)
         else: # Last attempt failed
             logger.error(
-                f"All RPC URLs failed for method '{method}' after {max_attempts} attempts."
+                f"All RPC URLs failed for {label} after {max_attempts} attempts."
             )
 
     error_summary = [f"URL {url}: {err}" for url, err in last_exception_per_url.items()]
     final_error_message = (
-        f"RPC method '{method}' failed for all URLs after {max_attempts} attempts. "
+        f"RPC {label} failed for all URLs after {max_attempts} attempts. "
         f"Last errors: {'; '.join(error_summary)}"
     )
     raise RuntimeError(final_error_message)
 
 
-def _execute_solana_cli_command(command_args: List[str], cluster_rpc_urls: List[str]) -> str:
+def _make_rpc_request(
+    cluster_rpc_urls: Sequence[str],
+    method: str,
+    params: Optional[List[Any]] = None,
+    max_retries_override: Optional[int] = None,
+    retry_delay_override: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Helper function to make a JSON-RPC request, iterating through URLs and retrying on failure.
+
+    Args:
+        cluster_rpc_urls: The RPC URLs for the target cluster, in the order they should be tried.
+        method: The RPC method name.
+        params: Optional list of parameters for the RPC method.
+        max_retries_override: Optional override for max_retries from config.
+        retry_delay_override: Optional override for retry_delay from config.
+
+    Returns:
+        The 'result' field from the JSON-RPC response.
+
+    Raises:
+        RuntimeError: If the request fails for all URLs after all retry attempts.
+    """
+    body = _rpc_envelope(1, method, params)
+
+    def extract_result(result_json: Dict[str, Any], rpc_url: str) -> Any:
+        if "error" in result_json:
+            raise RuntimeError(f"RPC error for method {method} on {rpc_url}: {result_json['error']}")
+        return result_json.get("result")
+
+    return _post_with_failover(
+        cluster_rpc_urls, body, f"method '{method}'", extract_result,
+        max_retries_override, retry_delay_override
+    )
+
+
+def _make_rpc_batch(
+    cluster_rpc_urls: Sequence[str],
+    calls: Sequence[Tuple[str, Optional[List[Any]]]]
+) -> List[Any]:
+    """
+    Sends several JSON-RPC calls as one batch request (a JSON array), so they share a single round trip.
+
+    Calls that fail inside an otherwise successful batch are retried individually with
+    _make_rpc_request. If the endpoints don't return a batch response at all (e.g. batching
+    is disabled), every call falls back to an individual request.
+
+    Args:
+        cluster_rpc_urls: The RPC URLs for the target cluster, in the order they should be tried.
+        calls: (method, params) pairs.
+
+    Returns:
+        One entry per call, in order: the call's 'result', or the RuntimeError it failed with.
+        Use _batch_value to unwrap entries whose failure should propagate.
+    """
+    if not calls:
+        return []
+
+    results: List[Any] = [None] * len(calls)
+    body = b"[" + b",".join(_rpc_envelope(call_id, method, params) for call_id, (method, params) in enumerate(calls)) + b"]"
+    label = f"batch [{', '.join(method for method, _ in calls)}]"
+
+    def extract_batch(result_json: Any, rpc_url: str) -> List[Any]:
+        if not isinstance(result_json, list):
+            raise RuntimeError(f"RPC {label} on {rpc_url} returned a non-batch response: {str(result_json)[:200]}")
+        return result_json
+
+    try:
+        # One pass over the URLs only; the individual fallback requests do their own retrying.
+        responses = _post_with_failover(cluster_rpc_urls, body, label, extract_batch, max_retries_override=0)
+    except RuntimeError as e:
+        logger.warning(f"{e} Falling back to individual requests.")
+        responses = []
+
+    responses_by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+
+    for call_id, (method, params) in enumerate(calls):
+        response = responses_by_id.get(call_id)
+        if response is not None and "error" not in response:
+            results[call_id] = response.get("result")
+            continue
+        if response is not None:
+            logger.warning(f"RPC error for method {method} in {label}: {response['error']}. Retrying individually.")
+        try:
+            results[call_id] = _make_rpc_request(cluster_rpc_urls, method, params)
+        except RuntimeError as e:
+            results[call_id] = e
+    return results
+
+
+def _batch_value(result: Any) -> Any:
+    """Returns a _make_rpc_batch entry, raising it instead if the call failed."""
+    if isinstance(result, RuntimeError):
+        raise result
+    return result
+
+
+def _execute_solana_cli_command(command_args: List[str], cluster_rpc_urls: Sequence[str]) -> bytes:
     """
     Executes a Solana CLI command using the first available RPC URL for the given cluster.
     Retries with the next RPC URL if the command fails with that specific URL.
+    Returns stdout as raw bytes, so JSON output can be parsed without an intermediate str copy.
     """
     base_command = ["solana"]
 
     for rpc_url in cluster_rpc_urls:
         full_command = base_command + ["--url", rpc_url] + command_args
         try:
-            process = subprocess.run(
-                full_command,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60  # Timeout for the CLI command execution
-            )
-            return process.stdout
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"CLI command '{' '.join(full_command)}' failed with error: {e.stderr}. Trying next RPC URL if available.")
+            with subprocess.Popen(full_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+                try:
+                    stdout, stderr = process.communicate(timeout=60)  # Timeout for the CLI command execution
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate() # Reap the killed process and drain its pipes
+                    raise
+            if process.returncode == 0:
+                return stdout
+            logger.warning(f"CLI command '{' '.join(full_command)}' failed with error: {stderr.decode(errors='replace')}. Trying next RPC URL if available.")
         except subprocess.TimeoutExpired:
             logger.warning(f"CLI command '{' '.join(full_command)}' timed out. Trying next RPC URL if available.")
         except Exception as e:
@@ -132,62 +333,133 @@ def _execute_solana_cli_command(command_args: List[str], cluster_rpc_urls: List[
     raise RuntimeError(f"Solana CLI command '{' '.join(command_args)}' failed for all provided RPC URLs.")
 
 
-def get_vote_accounts_rpc(cluster_rpc_urls: List[str]) -> Dict[str, Any]:
-    """Fetches vote accounts using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
-    return _make_rpc_request(cluster_rpc_urls, "getVoteAccounts")
+# Each _parse_* helper validates one method's raw 'result', so the single-call wrappers
+# below and batched calls in process_validator_data share the same checks.
 
-def get_epoch_info_rpc(cluster_rpc_urls: List[str]) -> Dict[str, Any]:
-    """Fetches epoch information using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
-    return _make_rpc_request(cluster_rpc_urls, "getEpochInfo")
-
-def get_cluster_nodes_rpc(cluster_rpc_urls: List[str]) -> List[Dict[str, Any]]:
-    """Fetches cluster node information using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
-    result = _make_rpc_request(cluster_rpc_urls, "getClusterNodes")
+def _parse_cluster_nodes(result: Any) -> List[Dict[str, Any]]:
     if not isinstance(result, list):
         logger.error(f"getClusterNodes RPC call returned non-list type: {type(result)}. Value: {result}")
         raise RuntimeError(f"getClusterNodes RPC call returned unexpected type: {type(result)}")
     return result
 
-
-def get_leader_schedule_rpc(cluster_rpc_urls: List[str]) -> Dict[str, Any]:
-    """Fetches the leader schedule for the current epoch (all validators) using JSON-RPC."""
-    result = _make_rpc_request(cluster_rpc_urls, "getLeaderSchedule", []) # No params needed for current epoch, all leaders
+def _parse_leader_schedule(result: Any) -> Dict[str, Any]:
     if not isinstance(result, dict):
         logger.error(f"getLeaderSchedule RPC call returned non-dict type: {type(result)}. Value: {result}")
         raise RuntimeError(f"getLeaderSchedule RPC call returned unexpected type: {type(result)}")
     return result
 
-def get_block_production_rpc(
-    cluster_rpc_urls: List[str],
-    identity_pubkey: str,
-    first_slot: int,
-    last_slot: int
-) -> Dict[str, Any]:
-    """Fetches block production data for a specific validator and slot range using JSON-RPC."""
-    params = [{
+def _parse_block_production(result: Any) -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        logger.error(f"getBlockProduction RPC call returned non-dict type: {type(result)}. Value: {result}")
+        raise RuntimeError(f"getBlockProduction RPC call returned unexpected type: {type(result)}")
+    return result
+
+def _parse_performance_samples(result: Any) -> List[Dict[str, Any]]:
+    if not isinstance(result, list):
+        logger.error(f"getRecentPerformanceSamples RPC call returned non-list type: {type(result)}. Value: {result}. Defaulting to empty list.")
+        return [] # Default to empty list to prevent downstream errors on unexpected type
+    return result
+
+def _parse_balance(result: Any, pubkey: str) -> Optional[int]:
+    """Returns the balance in lamports from a getBalance result (or RuntimeError batch entry), or None on error."""
+    if isinstance(result, RuntimeError):
+        logger.error(f"Failed to get balance for {pubkey} after all retries: {result}")
+        return None
+    # Expected result structure: {"context": {"slot": N}, "value": V}
+    if result is not None and isinstance(result.get("value"), int):
+        return result["value"]  # Balance is in lamports
+    logger.warning(f"getBalance for {pubkey} returned unexpected result structure: {result}")
+    return None
+
+def _parse_validator_infos(result: Any) -> List[Dict[str, Any]]:
+    """
+    Converts jsonParsed Config program accounts into the `solana validator-info get` output shape:
+    [{"identityPubkey": "...", "infoPubkey": "...", "info": {"name": "...", ...}}, ...]
+    Accounts that aren't parsed validator info are skipped.
+    """
+    if not isinstance(result, list):
+        logger.error(f"getProgramAccounts (validator info) RPC call returned non-list type: {type(result)}. Value: {result}")
+        raise RuntimeError(f"getProgramAccounts (validator info) RPC call returned unexpected type: {type(result)}")
+
+    validator_infos = []
+    for program_account in result:
+        data = program_account.get("account", {}).get("data")
+        parsed = data.get("parsed", {}) if isinstance(data, dict) else {}
+        if parsed.get("type") != "validatorInfo":
+            continue
+        info = parsed.get("info", {})
+        # The identity is the signing key; the non-signer key is VALIDATOR_INFO_KEY.
+        identity_pubkey = next((key.get("pubkey") for key in info.get("keys", []) if key.get("signer")), None)
+        if identity_pubkey is None:
+            continue
+        validator_infos.append({
+            "identityPubkey": identity_pubkey,
+            "infoPubkey": program_account.get("pubkey"),
+            "info": info.get("configData", {}),
+        })
+    return validator_infos
+
+def _validator_info_params(identity_pubkey: Optional[str] = None) -> List[Any]:
+    filters = [{"memcmp": {"offset": 1, "bytes": VALIDATOR_INFO_KEY}}]
+    if identity_pubkey:
+        filters.append({"memcmp": {"offset": _VALIDATOR_INFO_IDENTITY_OFFSET, "bytes": identity_pubkey}})
+    return [CONFIG_PROGRAM_ID, {"encoding": "jsonParsed", "filters": filters}]
+
+def _leader_schedule_params(identity_pubkey: Optional[str] = None) -> List[Any]:
+    if identity_pubkey:
+        return [None, {"identity": identity_pubkey}] # Current epoch, one validator
+    return [] # Current epoch, all leaders
+
+def _block_production_params(identity_pubkey: str, first_slot: Optional[int] = None, last_slot: Optional[int] = None) -> List[Any]:
+    if first_slot is None:
+        return [{"identity": identity_pubkey}] # Without a range the node reports the current epoch so far
+    return [{
         "identity": identity_pubkey,
         "range": {
             "firstSlot": first_slot,
             "lastSlot": last_slot
         }
     }]
-    result = _make_rpc_request(cluster_rpc_urls, "getBlockProduction", params)
-    if not isinstance(result, dict):
-        logger.error(f"getBlockProduction RPC call returned non-dict type: {type(result)}. Value: {result}")
-        raise RuntimeError(f"getBlockProduction RPC call returned unexpected type: {type(result)}")
-    return result
+
+def get_vote_accounts_rpc(cluster_rpc_urls: Sequence[str]) -> Dict[str, Any]:
+    """Fetches vote accounts using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
+    return _make_rpc_request(cluster_rpc_urls, "getVoteAccounts")
+
+def get_epoch_info_rpc(cluster_rpc_urls: Sequence[str]) -> Dict[str, Any]:
+    """Fetches epoch information using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
+    return _make_rpc_request(cluster_rpc_urls, "getEpochInfo")
+
+def get_cluster_nodes_rpc(cluster_rpc_urls: Sequence[str]) -> List[Dict[str, Any]]:
+    """Fetches cluster node information using JSON-RPC, utilizing the retry mechanism in _make_rpc_request."""
+    return _parse_cluster_nodes(_make_rpc_request(cluster_rpc_urls, "getClusterNodes"))
+
+
+def get_leader_schedule_rpc(cluster_rpc_urls: Sequence[str], identity_pubkey: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetches the leader schedule for the current epoch using JSON-RPC.
+    If identity_pubkey is given, only that validator's slots are returned (a much smaller response);
+    otherwise the schedule for all validators is returned.
+    """
+    params = _leader_schedule_params(identity_pubkey)
+    return _parse_leader_schedule(_make_rpc_request(cluster_rpc_urls, "getLeaderSchedule", params))
+
+def get_block_production_rpc(
+    cluster_rpc_urls: Sequence[str],
+    identity_pubkey: str,
+    first_slot: int,
+    last_slot: int
+) -> Dict[str, Any]:
+    """Fetches block production data for a specific validator and slot range using JSON-RPC."""
+    params = _block_production_params(identity_pubkey, first_slot, last_slot)
+    return _parse_block_production(_make_rpc_request(cluster_rpc_urls, "getBlockProduction", params))
 
 
-def get_recent_performance_samples_rpc(cluster_rpc_urls: List[str], limit: int = 720) -> List[Dict[str, Any]]:
+def get_recent_performance_samples_rpc(cluster_rpc_urls: Sequence[str], limit: int = 720) -> List[Dict[str, Any]]:
     """Fetches recent performance samples using JSON-RPC."""
     params = [limit]
-    result = _make_rpc_request(cluster_rpc_urls, "getRecentPerformanceSamples", params)
-    if not isinstance(result, list):
-        logger.error(f"getRecentPerformanceSamples RPC call returned non-list type: {type(result)}. Value: {result}. Defaulting to empty list.")
-        return [] # Default to empty list to prevent downstream errors on unexpected type
-    return result
+    return _parse_performance_samples(_make_rpc_request(cluster_rpc_urls, "getRecentPerformanceSamples", params))
 
-def get_balance_rpc(cluster_rpc_urls: List[str], pubkey: str) -> Optional[int]:
+def get_balance_rpc(cluster_rpc_urls: Sequence[str], pubkey: str) -> Optional[int]:
     """
     Fetches the balance for a given public key using JSON-RPC.
     Returns balance in lamports, or None if an error occurs after all retries.
@@ -196,32 +468,39 @@ def get_balance_rpc(cluster_rpc_urls: List[str], pubkey: str) -> Optional[int]:
         logger.warning("get_balance_rpc called with an empty pubkey.")
         return None
 
-    params = [pubkey]
-    try:
-        result = _make_rpc_request(cluster_rpc_urls, "getBalance", params)
-        # Expected result structure: {"context": {"slot": N}, "value": V}
-        if result is not None and isinstance(result.get("value"), int):
-            return result["value"]  # Balance is in lamports
-        else:
-            logger.warning(f"getBalance for {pubkey} returned unexpected result structure: {result}")
-            return None
-    except RuntimeError as e:
-        logger.error(f"Failed to get balance for {pubkey} after all retries: {e}")
-        return None
+    return get_balances_rpc(cluster_rpc_urls, [pubkey])[pubkey]
 
-# --- CLI Wrappers ---
-def get_validator_info_cli(cluster_rpc_urls: List[str]) -> List[Dict[str, Any]]:
-    """Fetches validator information using Solana CLI's 'validator-info get' command."""
-    output = _execute_solana_cli_command(
-        ["validator-info", "get", "--output", "json"],
-        cluster_rpc_urls
+def get_balances_rpc(cluster_rpc_urls: Sequence[str], pubkeys: Sequence[str]) -> Dict[str, Optional[int]]:
+    """
+    Fetches the balances for several public keys in a single JSON-RPC batch request.
+
+    Args:
+        cluster_rpc_urls: The RPC URLs for the target cluster.
+        pubkeys: The accounts to look up.
+
+    Returns:
+        A dict mapping each pubkey to its balance in lamports, or None if its lookup failed.
+    """
+    results = _make_rpc_batch(cluster_rpc_urls, [("getBalance", [pubkey]) for pubkey in pubkeys])
+    return {pubkey: _parse_balance(result, pubkey) for pubkey, result in zip(pubkeys, results)}
+
+def get_validator_info_rpc(cluster_rpc_urls: Sequence[str], identity_pubkey: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Fetches published validator info from the Config program using JSON-RPC.
+
+    Args:
+        cluster_rpc_urls: The RPC URLs for the target cluster.
+        identity_pubkey: If given, only that validator's info is fetched (filtered server-side).
+
+    Returns:
+        A list in the same shape as `solana validator-info get --output json`.
+    """
+    return _parse_validator_infos(
+        _make_rpc_request(cluster_rpc_urls, "getProgramAccounts", _validator_info_params(identity_pubkey))
     )
-    try:
-        return json.loads(output)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse JSON from validator-info CLI output: {e}\nOutput: {output}")
 
-def _get_validator_stake_info_cli(cluster_rpc_urls: List[str], validator_pubkey: str) -> list:
+# --- CLI Wrappers ---
+def _get_validator_stake_info_cli(cluster_rpc_urls: Sequence[str], validator_pubkey: str) -> list:
     """
     Fetches stake account data for a given validator pubkey using the Solana CLI 'stakes' command.
     Returns a list of stake accounts or an empty list on error.
@@ -234,9 +513,9 @@ def _get_validator_stake_info_cli(cluster_rpc_urls: List[str], validator_pubkey:
     ]
     try:
         output = _execute_solana_cli_command(command_args, cluster_rpc_urls)
-        return json.loads(output)
+        return loads(output)
     except json.JSONDecodeError as e:
-        logger.error(f"Error decoding JSON output from Solana CLI for stakes: {e}. Output: {output}")
+        logger.error(f"Error decoding JSON output from Solana CLI for stakes: {e}. Output: {output.decode(errors='replace')}")
         return []
     except RuntimeError as e:
         logger.error(f"Error executing Solana CLI command for stakes for {validator_pubkey}: {e}")
@@ -252,11 +531,6 @@ def _calculate_stake_metrics_from_data(stake_data: list) -> dict:
     Calculates various stake metrics from the raw stake data obtained from 'solana stakes'.
     All monetary values are returned in SOL.
     """
-    total_active_stake_lamports = 0
-    total_delegated_stake_lamports = 0
-    total_activating_stake_lamports = 0
-    total_deactivating_stake_lamports = 0
-
     if not stake_data:
         return {
             "total_active_stake_sol": 0.0,
@@ -266,19 +540,18 @@ def _calculate_stake_metrics_from_data(stake_data: list) -> dict:
             "net_stake_change_sol": 0.0,
         }
 
-    for account in stake_data:
-        active_stake = account.get("activeStake", 0)
-        delegated_stake = account.get("delegatedStake", 0)
-        deactivating_stake = account.get("deactivatingStake", 0)
-
-        total_active_stake_lamports += active_stake
-        total_delegated_stake_lamports += delegated_stake
-        total_deactivating_stake_lamports += deactivating_stake
-
-        # Activating stake is the portion of delegated stake that is not yet active.
-        activating_for_this_account = delegated_stake - active_stake
-        if activating_for_this_account > 0:
-            total_activating_stake_lamports += activating_for_this_account
+    # Pull each field into a flat list once and let the built-in sum() do the adding in C,
+    # instead of three .get() calls and scalar adds per account in an interpreted loop.
+    active_stakes = [account.get("activeStake", 0) for account in stake_data]
+    delegated_stakes = [account.get("delegatedStake", 0) for account in stake_data]
+
+    total_active_stake_lamports = sum(active_stakes)
+    total_delegated_stake_lamports = sum(delegated_stakes)
+    total_deactivating_stake_lamports = sum(account.get("deactivatingStake", 0) for account in stake_data)
+    # Activating stake is the portion of delegated stake that is not yet active.
+    total_activating_stake_lamports = sum(
+        delegated - active for delegated, active in zip(delegated_stakes, active_stakes) if delegated > active
+    )
 
     net_stake_change_lamports = total_activating_stake_lamports - total_deactivating_stake_lamports
 
@@ -290,10 +563,76 @@ def _calculate_stake_metrics_from_data(stake_data: list) -> dict:
         "net_stake_change_sol": net_stake_change_lamports / LAMPORTS_PER_SOL,
     }
 
-def _calculate_epoch_progress(epoch_info: Dict[str, Any], cluster_rpc_urls: List[str]) -> Tuple[float, str]:
+def _average_slot_time(performance_samples: List[Dict[str, Any]]) -> float:
+    """
+    Returns the recent average slot time in seconds, from getRecentPerformanceSamples results.
+    Falls back to Solana's 0.4s target slot time if no usable samples are available.
+    """
+    avg_slot_time_seconds = 0.4  # Default: Solana's target slot time (fallback)
+
+    if performance_samples:
+        # Accumulate both totals in one pass over the (up to 720) samples
+        total_slots = 0
+        total_time_secs = 0
+        valid_sample_count = 0
+        for sample in performance_samples:
+            num_slots = sample.get("numSlots", 0)
+            sample_period_secs = sample.get("samplePeriodSecs")
+            if num_slots > 0 and sample_period_secs is not None:
+                total_slots += num_slots
+                total_time_secs += sample_period_secs
+                valid_sample_count += 1
+        if valid_sample_count:
+            avg_slot_time_seconds = total_time_secs / total_slots
+            logger.debug("Calculated average slot time: %.4fs from %d samples.", avg_slot_time_seconds, valid_sample_count)
+        else:
+            logger.warning("No valid performance samples found; using default slot time.")
+    else:
+        logger.warning("Failed to fetch performance samples; using default slot time.")
+
+    return avg_slot_time_seconds
+
+def _compute_epoch_credits(epoch_credits: Optional[List[List[int]]], epoch: Optional[int]) -> Tuple[int, int]:
+    """
+    Finds a validator's credits for the given epoch in its getVoteAccounts epochCredits history.
+    Args:
+        epoch_credits (Optional[List[List[int]]]): [epoch, credits_cumulative_at_epoch_end, prev_credits_cumulative_at_epoch_end]
+            entries, oldest first.
+        epoch (Optional[int]): The epoch to look up, normally the current one.
+    Returns:
+        Tuple[int, int]: (cumulative credits, credits earned in the epoch), or (0, 0) if the epoch has no entry.
+    """
+    # The current epoch's entry (if any) is normally the last one, so search from the end
+    for ep_credits_tuple in reversed(epoch_credits or ()):
+        if len(ep_credits_tuple) != 3:
+            continue
+        entry_epoch, credits_cumulative, previous_credits_cumulative = ep_credits_tuple
+        if entry_epoch == epoch:
+            return credits_cumulative, credits_cumulative - previous_credits_cumulative
+    return 0, 0
+
+def _compute_skip(assigned_slots: int, produced_blocks: int) -> Tuple[int, float]:
+    """
+    Computes skipped leader slots and the skip rate from getBlockProduction's byIdentity counts.
+    Args:
+        assigned_slots (int): Leader slots that have passed within the block production range.
+            This is the most direct measure of *expected* slots, so it is the skip rate's denominator.
+        produced_blocks (int): Blocks produced in those slots.
+    Returns:
+        Tuple[int, float]: (skipped slots, skip rate in percent). Both are 0 if no slots were assigned.
+    """
+    if assigned_slots <= 0:
+        return 0, 0.0
+    skipped_slots = assigned_slots - produced_blocks
+    return skipped_slots, (skipped_slots / assigned_slots) * 100.0
+
+# (label, seconds per unit), largest first, for the "time left in epoch" string
+_TIME_UNITS = (("day", 86400), ("hour", 3600), ("min", 60), ("sec", 1))
+
+def _calculate_epoch_progress(epoch_info: Dict[str, Any], avg_slot_time_seconds: float) -> Tuple[float, str]:
     """
     Calculates epoch percentage complete and estimated time left in the current epoch.
-    Uses getRecentPerformanceSamples for a more accurate average slot time.
+    avg_slot_time_seconds should come from _average_slot_time for a more accurate estimate.
     """
     slot_index = epoch_info.get("slotIndex")
     slots_in_epoch = epoch_info.get("slotsInEpoch")
@@ -304,41 +643,16 @@ def _calculate_epoch_progress(epoch_info: Dict[str, Any], cluster_rpc_urls: List
 
     percent_complete = (slot_index / slots_in_epoch) * 100
 
-    avg_slot_time_seconds = 0.4  # Default: Solana's target slot time (fallback)
-    performance_samples = get_recent_performance_samples_rpc(cluster_rpc_urls, limit=720)
-
-    if performance_samples:
-        valid_samples = [s for s in performance_samples if s.get("numSlots", 0) > 0 and s.get("samplePeriodSecs") is not None]
-        if valid_samples:
-            total_slots = sum(sample["numSlots"] for sample in valid_samples)
-            total_time_secs = sum(sample["samplePeriodSecs"] for sample in valid_samples)
-            if total_slots > 0:
-                avg_slot_time_seconds = total_time_secs / total_slots
-                logger.debug(f"Calculated average slot time: {avg_slot_time_seconds:.4f}s from {len(valid_samples)} samples.")
-            else:
-                logger.warning("No slots found in valid performance samples; using default slot time.")
-        else:
-            logger.warning("No valid performance samples found; using default slot time.")
-    else:
-        logger.warning("Failed to fetch performance samples; using default slot time.")
-
     remaining_slots = slots_in_epoch - slot_index
     time_remaining_seconds = remaining_slots * avg_slot_time_seconds
 
-    # Format time_remaining_seconds into a human-readable string
-    days, remainder = divmod(time_remaining_seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
-
+    # Format time_remaining_seconds into a human-readable string, one divmod per unit
     parts = []
-    if days > 0:
-        parts.append(f"{int(days)} day{'s' if int(days) != 1 else ''}")
-    if hours > 0:
-        parts.append(f"{int(hours)} hour{'s' if int(hours) != 1 else ''}")
-    if minutes > 0:
-        parts.append(f"{int(minutes)} min{'s' if int(minutes) != 1 else ''}")
-    if not parts and seconds > 0: # Show seconds only if no larger units are present
-         parts.append(f"{int(seconds)} sec{'s' if int(seconds) != 1 else ''}")
+    remaining = int(time_remaining_seconds)
+    for unit_name, unit_seconds in _TIME_UNITS:
+        quantity, remaining = divmod(remaining, unit_seconds)
+        if quantity and (unit_seconds > 1 or not parts): # Show seconds only if no larger units are present
+            parts.append(f"{quantity} {unit_name}{'s' if quantity != 1 else ''}")
 
     if not parts: # If remaining time is very short or zero
         time_left_str = "Nearly complete" if percent_complete > 99.9 else "Calculating..."
@@ -348,20 +662,20 @@ def _calculate_epoch_progress(epoch_info: Dict[str, Any], cluster_rpc_urls: List
     return percent_complete, time_left_str
 
 
-def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
+def process_validator_data(cluster_shorthand: str) -> Optional[ValidatorReport]:
     """
     Fetches, processes, and prepares all validator data for a given cluster.
 
     This is the main data aggregation function. It calls various RPC and CLI helper
-    functions, processes the data, and compiles it into a dictionary.
+    functions, processes the data, and compiles it into a ValidatorReport.
 
     Args:
         cluster_shorthand (str): 'um' for mainnet, 'ut' for testnet.
 
     Returns:
-        A dictionary with formatted data ready for Discord, or None on critical failure.
+        A ValidatorReport with the data ready for Discord, or None on critical failure.
     """
-    logger.info(f"Starting data processing for cluster: {cluster_shorthand}...")
+    logger.info("Starting data processing for cluster: %s...", cluster_shorthand)
 
     try:
         rpc_urls = get_rpc_urls(cluster_shorthand)
@@ -374,29 +688,49 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Error: No RPC URLs configured for cluster {cluster_shorthand}.")
         return None
 
-    logger.info(f"Using RPC URLs: {rpc_urls} for cluster {cluster_shorthand}")
-    logger.info(f"Target Validator ID: {validator_identity_pubkey}")
+    logger.info("Using RPC URLs: %s for cluster %s", rpc_urls, cluster_shorthand)
+    logger.info("Target Validator ID: %s", validator_identity_pubkey)
 
+    # The stakes CLI call runs on the shared worker pool while the RPC data is fetched, so the
+    # total wait is roughly the slower of the two instead of their sum.
+    executor = _FETCH_EXECUTOR
     try:
-        # 1. Fetch core data concurrently (or sequentially if easier to manage)
-        logger.info("Fetching vote accounts...")
-        vote_accounts_data = get_vote_accounts_rpc(rpc_urls)
+        # 1. Fetch core data. None of these depend on each other, only on config.
+        logger.info("Fetching stake data (CLI)...")
+        stake_raw_future = executor.submit(_get_validator_stake_info_cli, rpc_urls, validator_identity_pubkey)
+
+        # The RPC data goes out as a single JSON-RPC batch (one HTTP round trip), keyed by name.
+        # Everything here needs only the configured identity.
+        logger.info("Fetching vote accounts, validator info, epoch info, cluster nodes, leader schedule, block production and balances (batched)...")
+        round_one_calls = {
+            "vote_accounts": ("getVoteAccounts", None),
+            "validator_infos": ("getProgramAccounts", _validator_info_params(validator_identity_pubkey)),
+            "epoch_info": ("getEpochInfo", None),
+            "cluster_nodes": ("getClusterNodes", None),
+            "leader_schedule": ("getLeaderSchedule", _leader_schedule_params(validator_identity_pubkey)), # Only our slots; the full schedule is MBs
+            "block_production": ("getBlockProduction", _block_production_params(validator_identity_pubkey)), # Current epoch so far
+            "identity_balance": ("getBalance", [validator_identity_pubkey]),
+            "performance_samples": ("getRecentPerformanceSamples", [720]),
+        }
+        round_one_results = dict(zip(round_one_calls, _make_rpc_batch(rpc_urls, list(round_one_calls.values()))))
+
+        performance_samples = _parse_performance_samples(_batch_value(round_one_results["performance_samples"]))
+        avg_slot_time_seconds = _average_slot_time(performance_samples)
+
+        vote_accounts_data = _batch_value(round_one_results["vote_accounts"])
         # Example `getVoteAccounts` structure:
         # { "current": [{"identityPubkey": "...", "epochCredits": [[epoch, credits, prev_credits], ...], ...}],
         #   "delinquent": [...] }
 
-        logger.info("Fetching validator info (CLI)...")
-        validator_infos_list = get_validator_info_cli(rpc_urls)
-        # Example `validator-info get` (list of dicts):
+        validator_infos_list = _parse_validator_infos(_batch_value(round_one_results["validator_infos"]))
+        # Same shape as `validator-info get` (list of dicts):
         # [{ "identityPubkey": "...", "info": {"name": "ValidatorName"}, ...}]
 
-        logger.info("Fetching epoch info...")
-        epoch_info_data = get_epoch_info_rpc(rpc_urls)
+        epoch_info_data = _batch_value(round_one_results["epoch_info"])
         # Example `getEpochInfo` structure:
         # { "epoch": N, "slotIndex": X, "slotsInEpoch": Y, "absoluteSlot": Z, ... }
 
-        logger.info(f"Fetching stake data for validator: {validator_identity_pubkey}...")
-        stake_raw_data = _get_validator_stake_info_cli(rpc_urls, validator_identity_pubkey)
+        stake_raw_data = stake_raw_future.result()
         stake_metrics = _calculate_stake_metrics_from_data(stake_raw_data)
 
         # Unpack stake_metrics into local variables for consistent return statement
@@ -406,8 +740,7 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
         stake_deactivating_sol_val = stake_metrics["stake_deactivating_sol"]
         net_stake_change_sol_val = stake_metrics["net_stake_change_sol"]
 
-        logger.info("Fetching cluster nodes info...")
-        cluster_nodes_data = get_cluster_nodes_rpc(rpc_urls)
+        cluster_nodes_data = _parse_cluster_nodes(_batch_value(round_one_results["cluster_nodes"]))
         # Example `getClusterNodes` result is a list of objects:
         # [ { "pubkey": "...", "gossip": "IP:PORT", "tpu": "IP:PORT", "rpc": "IP:PORT",
         #     "version": "1.x.y ...", ... }, ... ]
@@ -421,59 +754,45 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
             # For now, we'll let it proceed, and our_validator_data might not be found.
             # return None # Consider if this is fatal
 
+        # One pass computes every validator's credits for this epoch, the rank 1 credits and our own entry.
+        # Ranking only counts validators with positive earned credits, ordered by credits (ties keep list order).
         current_epoch_from_rpc = epoch_info_data.get("epoch")
-        processed_validators = []
-        for val in all_validators:
-            current_credits_cumulative = 0
-            previous_credits_cumulative = 0
-            credits_in_current_epoch = 0
-
-            # epochCredits is a list of [epoch, credits_cumulative_at_epoch_end, prev_credits_cumulative_at_epoch_end]
-            for ep_credits_tuple in val.get("epochCredits", []):
-                if len(ep_credits_tuple) == 3 and ep_credits_tuple[0] == current_epoch_from_rpc:
-                    current_credits_cumulative = ep_credits_tuple[1]
-                    previous_credits_cumulative = ep_credits_tuple[2]
-                    # Credits earned in this specific epoch entry
-                    credits_in_current_epoch = current_credits_cumulative - previous_credits_cumulative
-                    break
-            val["currentEpochCreditsCumulative"] = current_credits_cumulative
-            val["currentEpochCreditsEarned"] = credits_in_current_epoch
-            processed_validators.append(val)
-
-        # Filter out validators with zero or negative current epoch credits earned for ranking purposes
-        ranked_validators = sorted(
-            [v for v in processed_validators if v.get("currentEpochCreditsEarned", 0) > 0],
-            key=lambda x: x.get("currentEpochCreditsEarned", 0),
-            reverse=True
-        )
-
-        if not ranked_validators:
+        credits_earned_per_validator = [] # Parallel to all_validators
+        credits_earned_rank_1 = 0
+        our_index = None
+        our_validator_data = None
+        append_credits_earned = credits_earned_per_validator.append
+        for index, val in enumerate(all_validators):
+            current_credits_cumulative, credits_in_current_epoch = _compute_epoch_credits(val.get("epochCredits"), current_epoch_from_rpc)
+            append_credits_earned(credits_in_current_epoch)
+            if credits_in_current_epoch > credits_earned_rank_1:
+                credits_earned_rank_1 = credits_in_current_epoch
+
+            if our_index is None and val.get("nodePubkey") == validator_identity_pubkey:
+                our_index = index
+                our_validator_data = val
+                our_validator_data["currentEpochCreditsCumulative"] = current_credits_cumulative
+                our_validator_data["currentEpochCreditsEarned"] = credits_in_current_epoch
+
+        if credits_earned_rank_1 <= 0:
             logger.warning("No validators with positive epoch credits earned found for ranking.")
 
-        # Assign rank
-        for i, val in enumerate(ranked_validators):
-            val["rank"] = i + 1
+        # Rank = 1 + validators ahead of us: more credits, or equal credits earlier in the list.
+        if our_validator_data and our_validator_data["currentEpochCreditsEarned"] > 0:
+            our_credits_earned = our_validator_data["currentEpochCreditsEarned"]
+            validators_ahead = 0
+            for index, credits_earned in enumerate(credits_earned_per_validator):
+                if credits_earned > our_credits_earned or (credits_earned == our_credits_earned and index < our_index):
+                    validators_ahead += 1
+            our_validator_data["rank"] = validators_ahead + 1
 
-        our_validator_data = None
-        # Try to find in ranked list first
-        if ranked_validators:
-            for val_ranked in ranked_validators:
-                if val_ranked.get("nodePubkey") == validator_identity_pubkey:
-                    our_validator_data = val_ranked
-                    break
-
-        if not our_validator_data: # If not in ranked, search in all processed validators
+        if not our_validator_data or "rank" not in our_validator_data: # Not in the ranked list
             logger.warning(f"Validator {validator_identity_pubkey} not found in the ranked list (or list was empty). Searching unranked list.")
-            found_in_all_validators = False
-            for val_orig in processed_validators: # Use processed_validators which has 'currentEpochCreditsEarned'
-                if val_orig.get("nodePubkey") == validator_identity_pubkey:
-                    logger.info(f"Validator {validator_identity_pubkey} found in the unranked list (likely 0 or negative earned credits).")
-                    logger.info(f"Data for {validator_identity_pubkey}: epochCredits={val_orig.get('epochCredits')}, currentEpochCreditsEarned={val_orig.get('currentEpochCreditsEarned', 'N/A')}")
-                    our_validator_data = val_orig
-                    our_validator_data['rank'] = 'N/A' # Explicitly set rank to N/A
-                    found_in_all_validators = True
-                    break
-            if not found_in_all_validators:
+            if our_validator_data:
+                logger.info("Validator %s found in the unranked list (likely 0 or negative earned credits).", validator_identity_pubkey)
+                logger.info("Data for %s: epochCredits=%s, currentEpochCreditsEarned=%s", validator_identity_pubkey, our_validator_data.get("epochCredits"), our_validator_data.get("currentEpochCreditsEarned", "N/A"))
+                our_validator_data['rank'] = 'N/A' # Explicitly set rank to N/A
+            else:
                 logger.error(f"Validator {validator_identity_pubkey} not found in any validator list from getVoteAccounts.")
                 # This is a critical point. If our validator isn't found, many metrics will be missing.
                 # Consider returning None or having default "N/A" values for all validator-specific fields.
@@ -488,59 +807,52 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
         vote_account = our_validator_data.get("votePubkey", "N/A")
         epoch_credits_earned = our_validator_data.get("currentEpochCreditsEarned", 0 if rank != "N/A" else "N/A")
 
+        # The vote account is only known now that getVoteAccounts has resolved it, so its balance can't
+        # be in the first batch. Start that lookup here so it overlaps the processing below.
+        vote_account_balance_future = executor.submit(get_balance_rpc, rpc_urls, vote_account) if vote_account != "N/A" else None
+
         # Extract validator version and IP from cluster_nodes_data
         validator_client_version = "N/A"
         validator_ip_address = "N/A"
         if cluster_nodes_data: # Ensure cluster_nodes_data is not None (e.g. if RPC failed)
-            for node_info in cluster_nodes_data:
-                if node_info.get("pubkey") == identity: # Use the identity we confirmed for our validator
-                    validator_client_version = node_info.get("version", "N/A")
-                    gossip_address = node_info.get("gossip")
-                    if gossip_address:
-                        validator_ip_address = gossip_address.split(":")[0] # Remove port
-                    else:
-                        validator_ip_address = "N/A" # Explicit N/A if gossip is None
-                    logger.info(f"Found node info for {identity}: Version='{validator_client_version}', Gossip='{gossip_address}', IP='{validator_ip_address}'")
-                    break
+            node_info = next((n for n in cluster_nodes_data if n.get("pubkey") == identity), None) # Use the identity we confirmed for our validator
+            if node_info:
+                validator_client_version = node_info.get("version", "N/A")
+                gossip_address = node_info.get("gossip")
+                if gossip_address:
+                    # Remove the port from the last colon, so IPv6 gossip addresses ("[2001:db8::1]:8001") stay whole
+                    validator_ip_address = gossip_address.rpartition(":")[0].strip("[]") or gossip_address
+                else:
+                    validator_ip_address = "N/A" # Explicit N/A if gossip is None
+                logger.info("Found node info for %s: Version='%s', Gossip='%s', IP='%s'", identity, validator_client_version, gossip_address, validator_ip_address)
             else:
                 logger.warning(f"Could not find node info for {identity} in getClusterNodes output.")
         else:
             logger.warning("cluster_nodes_data was empty or None; version/IP will be N/A.")
 
 
-        # Fetch balances
-        identity_balance_lamports = get_balance_rpc(rpc_urls, identity) if identity != "N/A" else None
-        vote_account_balance_lamports = get_balance_rpc(rpc_urls, vote_account) if vote_account != "N/A" else None
-
-        identity_balance_sol = identity_balance_lamports / LAMPORTS_PER_SOL if identity_balance_lamports is not None else "N/A"
-        vote_account_balance_sol = vote_account_balance_lamports / LAMPORTS_PER_SOL if vote_account_balance_lamports is not None else "N/A"
-
-        logger.info(f"Validator Identity Account ({identity}) Balance: {identity_balance_sol} SOL")
-        logger.info(f"Validator Vote Account ({vote_account}) Balance: {vote_account_balance_sol} SOL")
-
         active_stake_lamports = our_validator_data.get("activatedStake", 0)
         active_stake_sol = active_stake_lamports / LAMPORTS_PER_SOL
 
-        # Get validator name from validator_infos_list (CLI data)
+        # Get validator name from validator_infos_list (Config program data)
         validator_name = "Unknown"
-        if validator_infos_list: # Ensure CLI data was fetched
-            for vi_entry in validator_infos_list:
-                if vi_entry.get("identityPubkey") == identity:
-                    validator_name = vi_entry.get("info", {}).get("name", "Unknown")
-                    if validator_name == "null" or not validator_name: # Handle literal "null" or empty name
-                        validator_name = identity[:12] + "..." # Fallback to shortened pubkey if name is invalid/missing
-                    break
-            else: # Validator not found in CLI info list
+        if validator_infos_list: # Ensure validator info was found
+            vi_entry = next((v for v in validator_infos_list if v.get("identityPubkey") == identity), None)
+            if vi_entry:
+                try:
+                    validator_name = vi_entry["info"]["name"]
+                except (KeyError, TypeError): # No info dict, or no name in it
+                    validator_name = "Unknown"
+                if validator_name == "null" or not validator_name: # Handle literal "null" or empty name
+                    validator_name = identity[:12] + "..." # Fallback to shortened pubkey if name is invalid/missing
+            else: # Validator not found in info list
                  validator_name = identity[:12] + "..." # Fallback name
-        else: # CLI data fetch failed
+        else: # No validator info published
             validator_name = identity[:12] + "..." # Fallback name
 
 
         # 4. Calculate missed credits relative to rank 1 (if rank 1 exists and has credits)
-        credits_earned_rank_1 = 0
-        if ranked_validators and ranked_validators[0].get("currentEpochCreditsEarned", 0) > 0:
-            credits_earned_rank_1 = ranked_validators[0].get("currentEpochCreditsEarned", 0)
-
+        # credits_earned_rank_1 was found while ranking; it stays 0 if no validator earned credits.
         missed_credits = "N/A"
         if isinstance(epoch_credits_earned, (int, float)) and isinstance(credits_earned_rank_1, (int, float)) and credits_earned_rank_1 > 0:
             missed_credits = credits_earned_rank_1 - epoch_credits_earned
@@ -552,7 +864,7 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
 
         # 5. Epoch details
         current_epoch = epoch_info_data.get("epoch", "N/A") # Fallback if epoch_info_data is problematic
-        epoch_percent_complete, time_left_in_epoch = _calculate_epoch_progress(epoch_info_data, rpc_urls)
+        epoch_percent_complete, time_left_in_epoch = _calculate_epoch_progress(epoch_info_data, avg_slot_time_seconds)
 
 
         # 6. Leader Slot Metrics
@@ -561,11 +873,12 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
         leader_slots_upcoming_count = 0
         leader_slots_skipped = 0
         leader_skip_rate = 0.0
+        check_block_production = False # Set once we know there are completed leader slots to check
 
         if identity != "N/A": # Only proceed if we have a valid validator identity
-            logger.info(f"Fetching leader schedule for epoch {current_epoch}...")
+            logger.info("Processing leader schedule for epoch %s...", current_epoch)
             try:
-                leader_schedule_data = get_leader_schedule_rpc(rpc_urls)
+                leader_schedule_data = _parse_leader_schedule(_batch_value(round_one_results["leader_schedule"]))
                 # Example: { "<pubkey>": [slot_idx1, slot_idx2,...], ... }
 
                 validator_slots_in_epoch = leader_schedule_data.get(identity, [])
@@ -574,86 +887,89 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
                 if leader_slots_total > 0:
                     current_slot_in_epoch = epoch_info_data.get("slotIndex", 0) # Default to 0 if not found
 
-                    completed_slots_this_epoch = [s for s in validator_slots_in_epoch if s <= current_slot_in_epoch]
-                    leader_slots_completed_count = len(completed_slots_this_epoch)
+                    # The schedule lists slot indexes in ascending order, so the completed ones are a prefix
+                    leader_slots_completed_count = bisect.bisect_right(validator_slots_in_epoch, current_slot_in_epoch)
                     leader_slots_upcoming_count = leader_slots_total - leader_slots_completed_count
 
                     # For blockProduction, Solana RPC expects absolute slot numbers.
                     # epoch_info_data["absoluteSlot"] is the current absolute slot.
                     # epoch_info_data["slotIndex"] is slots processed in current epoch.
                     # So, first slot of current epoch = absoluteSlot - slotIndex
-                    epoch_start_absolute_slot = epoch_info_data.get("absoluteSlot", 0) - current_slot_in_epoch
                     current_absolute_slot = epoch_info_data.get("absoluteSlot", 0)
+                    epoch_start_absolute_slot = current_absolute_slot - current_slot_in_epoch
 
                     # Only fetch block production if there are completed slots and a valid slot range
                     if leader_slots_completed_count > 0 and epoch_start_absolute_slot < current_absolute_slot:
-                        logger.info(f"Fetching block production for {identity} in epoch {current_epoch} (slots {epoch_start_absolute_slot} to {current_absolute_slot})...")
-                        try:
-                            block_production_info = get_block_production_rpc(
-                                rpc_urls,
-                                identity,
-                                epoch_start_absolute_slot,
-                                current_absolute_slot
-                            )
-                            # Expected structure: {"value": {"byIdentity": {<identity>: [assigned_slots, produced_blocks]}}}
-                            validator_bp_stats = block_production_info.get("value", {}).get("byIdentity", {}).get(identity)
-                            if validator_bp_stats and len(validator_bp_stats) == 2:
-                                assigned_slots_in_bp_range = validator_bp_stats[0]
-                                blocks_produced_in_bp_range = validator_bp_stats[1]
-
-                                # For skip rate, the denominator should be the number of *expected* leader slots
-                                # that have passed within the block production query range.
-                                # This 'assigned_slots_in_bp_range' from getBlockProduction is the most direct measure.
-                                if assigned_slots_in_bp_range > 0:
-                                    leader_slots_skipped = assigned_slots_in_bp_range - blocks_produced_in_bp_range
-                                    leader_skip_rate = (leader_slots_skipped / assigned_slots_in_bp_range) * 100.0 if assigned_slots_in_bp_range > 0 else 0.0
-                                else: # No slots assigned in the block production range as per getBlockProduction
-                                    leader_slots_skipped = 0
-                                    leader_skip_rate = 0.0
-                                logger.info(f"Block production for {identity}: AssignedInBP={assigned_slots_in_bp_range}, ProducedInBP={blocks_produced_in_bp_range}, CalculatedSkipped={leader_slots_skipped}")
-                            else:
-                                logger.warning(f"Block production data for {identity} was missing or not in expected format: {validator_bp_stats}. Skipped/rate will be 0.")
-                        except RuntimeError as e:
-                            logger.error(f"Could not fetch block production for {identity}: {e}. Skipped/rate will be 0.")
+                        check_block_production = True
                     else:
-                         logger.info(f"Skipping block production check for {identity} as no completed leader slots yet, or invalid slot range.")
+                         logger.info("Skipping block production check for %s as no completed leader slots yet, or invalid slot range.", identity)
                 else:
-                    logger.info(f"Validator {identity} has no leader slots in the current epoch {current_epoch}.")
+                    logger.info("Validator %s has no leader slots in the current epoch %s.", identity, current_epoch)
             except RuntimeError as e:
                  logger.error(f"Could not fetch leader schedule: {e}. Leader slot metrics will be 0.")
         else: # identity was N/A
             logger.warning("Skipping leader slot metrics calculation as validator identity is N/A.")
 
 
-        logger.info(f"Successfully processed data for {validator_name} ({identity}) on cluster {cluster_shorthand}.")
+        # 7. Balances. The identity balance came with the first batch; the vote account balance lookup
+        # was started on the worker pool after step 3.
+        identity_balance_lamports = _parse_balance(round_one_results["identity_balance"], identity)
+        vote_account_balance_lamports = vote_account_balance_future.result() if vote_account_balance_future is not None else None
 
-        return {
-            "cluster_shorthand": cluster_shorthand,
-            "validator_name": validator_name,
-            "active_stake_sol": active_stake_sol, # From vote account
-            "current_epoch": current_epoch,
-            "epoch_percent_complete": epoch_percent_complete,
-            "time_left_in_epoch": time_left_in_epoch,
-            "rank": rank,
-            "epoch_credits": epoch_credits_earned,
-            "missed_credits": missed_credits,
-            "identity_pubkey": identity,
-            "vote_account_pubkey": vote_account,
-            "identity_balance_sol": identity_balance_sol,
-            "vote_account_balance_sol": vote_account_balance_sol,
-            "validator_version": validator_client_version,
-            "validator_ip": validator_ip_address,
-            "total_active_stake_sol": total_active_stake_sol_val,
-            "total_delegated_stake_sol": total_delegated_stake_sol_val,
-            "stake_activating_sol": stake_activating_sol_val,
-            "stake_deactivating_sol": stake_deactivating_sol_val,
-            "net_stake_change_sol": net_stake_change_sol_val,
-            "leader_slots_total": leader_slots_total,
-            "leader_slots_completed": leader_slots_completed_count,
-            "leader_slots_upcoming": leader_slots_upcoming_count,
-            "leader_slots_skipped": leader_slots_skipped,
-            "leader_skip_rate": leader_skip_rate,
-        }
+        identity_balance_sol = identity_balance_lamports / LAMPORTS_PER_SOL if identity_balance_lamports is not None else "N/A"
+        vote_account_balance_sol = vote_account_balance_lamports / LAMPORTS_PER_SOL if vote_account_balance_lamports is not None else "N/A"
+
+        logger.info("Validator Identity Account (%s) Balance: %s SOL", identity, identity_balance_sol)
+        logger.info("Validator Vote Account (%s) Balance: %s SOL", vote_account, vote_account_balance_sol)
+
+        if check_block_production:
+            try:
+                block_production_info = _parse_block_production(_batch_value(round_one_results["block_production"]))
+                # Expected structure: {"value": {"byIdentity": {<identity>: [assigned_slots, produced_blocks]}}}
+                # One walk instead of chained .get() calls; a missing level (or a null "value") means no stats
+                try:
+                    validator_bp_stats = block_production_info["value"]["byIdentity"][identity]
+                except (KeyError, TypeError):
+                    validator_bp_stats = None
+                if validator_bp_stats and len(validator_bp_stats) == 2:
+                    assigned_slots_in_bp_range, blocks_produced_in_bp_range = validator_bp_stats
+                    leader_slots_skipped, leader_skip_rate = _compute_skip(assigned_slots_in_bp_range, blocks_produced_in_bp_range)
+                    logger.info("Block production for %s: AssignedInBP=%s, ProducedInBP=%s, CalculatedSkipped=%s", identity, assigned_slots_in_bp_range, blocks_produced_in_bp_range, leader_slots_skipped)
+                else:
+                    logger.warning(f"Block production data for {identity} was missing or not in expected format: {validator_bp_stats}. Skipped/rate will be 0.")
+            except RuntimeError as e:
+                logger.error(f"Could not fetch block production for {identity}: {e}. Skipped/rate will be 0.")
+
+
+        logger.info("Successfully processed data for %s (%s) on cluster %s.", validator_name, identity, cluster_shorthand)
+
+        return ValidatorReport(
+            cluster_shorthand=cluster_shorthand,
+            validator_name=validator_name,
+            active_stake_sol=active_stake_sol, # From vote account
+            current_epoch=current_epoch,
+            epoch_percent_complete=epoch_percent_complete,
+            time_left_in_epoch=time_left_in_epoch,
+            rank=rank,
+            epoch_credits=epoch_credits_earned,
+            missed_credits=missed_credits,
+            identity_pubkey=identity,
+            vote_account_pubkey=vote_account,
+            identity_balance_sol=identity_balance_sol,
+            vote_account_balance_sol=vote_account_balance_sol,
+            validator_version=validator_client_version,
+            validator_ip=validator_ip_address,
+            total_active_stake_sol=total_active_stake_sol_val,
+            total_delegated_stake_sol=total_delegated_stake_sol_val,
+            stake_activating_sol=stake_activating_sol_val,
+            stake_deactivating_sol=stake_deactivating_sol_val,
+            net_stake_change_sol=net_stake_change_sol_val,
+            leader_slots_total=leader_slots_total,
+            leader_slots_completed=leader_slots_completed_count,
+            leader_slots_upcoming=leader_slots_upcoming_count,
+            leader_slots_skipped=leader_slots_skipped,
+            leader_skip_rate=leader_skip_rate,
+        )
 
     except RuntimeError as e: # Catch RuntimeErrors from RPC/CLI calls if they exhausted retries
         logger.error(f"Critical Runtime Error during data processing for cluster {cluster_shorthand}: {e}")
@@ -664,52 +980,30 @@ def process_validator_data(cluster_shorthand: str) -> Optional[Dict[str, Any]]:
 
 # --- Main Execution ---
 
-def report_validator_status(cluster_shorthand: str):
+def report_validator_status(cluster_shorthand: str, discord_client: Optional[DiscordClient] = None):
     """
     Main function to fetch validator status for a cluster and send it to Discord.
 
     Args:
         cluster_shorthand (str): 'um' for mainnet or 'ut' for testnet.
+        discord_client (Optional[DiscordClient]): Client to send the report with.
+            Defaults to the shared client for the configured webhook.
     """
     # Fallback logging config if no handlers are set (e.g. if module is used unexpectedly)
     # main.py should already configure logging based on config.toml.
     if not logging.getLogger().hasHandlers():
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 
-    logger.info(f"Reporting validator status for cluster: {cluster_shorthand.upper()}")
-
-    data_to_report = process_validator_data(cluster_shorthand)
-
-    if data_to_report:
-        success = format_and_send_status(
-            cluster_name=data_to_report["cluster_shorthand"],
-            validator_name=data_to_report["validator_name"],
-            active_stake_sol=data_to_report["active_stake_sol"],
-            current_epoch=data_to_report["current_epoch"],
-            epoch_percent_complete=data_to_report["epoch_percent_complete"],
-            time_left_in_epoch=data_to_report["time_left_in_epoch"],
-            rank=data_to_report["rank"],
-            epoch_credits=data_to_report["epoch_credits"],
-            missed_credits=data_to_report["missed_credits"],
-            identity_pubkey=data_to_report["identity_pubkey"],
-            vote_account_pubkey=data_to_report["vote_account_pubkey"],
-            identity_balance_sol=data_to_report["identity_balance_sol"],
-            vote_account_balance_sol=data_to_report["vote_account_balance_sol"],
-            total_active_stake_sol=data_to_report["total_active_stake_sol"],
-            total_delegated_stake_sol=data_to_report["total_delegated_stake_sol"],
-            stake_activating_sol=data_to_report["stake_activating_sol"],
-            stake_deactivating_sol=data_to_report["stake_deactivating_sol"],
-            net_stake_change_sol=data_to_report["net_stake_change_sol"],
-            validator_version=data_to_report["validator_version"],
-            validator_ip=data_to_report["validator_ip"],
-            leader_slots_total=data_to_report["leader_slots_total"],
-            leader_slots_completed=data_to_report["leader_slots_completed"],
-            leader_slots_upcoming=data_to_report["leader_slots_upcoming"],
-            leader_slots_skipped=data_to_report["leader_slots_skipped"],
-            leader_skip_rate=data_to_report["leader_skip_rate"]
-        )
+    logger.info("Reporting validator status for cluster: %s", cluster_shorthand.upper())
+
+    report = process_validator_data(cluster_shorthand)
+
+    if report is not None:
+        if discord_client is None:
+            discord_client = get_discord_client()
+        success = discord_client.format_and_send_status(report)
         if success:
-            logger.info(f"Successfully sent Discord notification for cluster {cluster_shorthand.upper()}.")
+            logger.info("Successfully sent Discord notification for cluster %s.", cluster_shorthand.upper())
         else:
             logger.error(f"Failed to send Discord notification for cluster {cluster_shorthand.upper()}.")
     else:
@@ -0,0 +1,26 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson # Optional: faster parsing of large RPC responses and encoding of request bodies
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses JSON, using orjson when it is installed.
+    Both parsers raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes obj to compact UTF-8 JSON bytes, using orjson when it is installed.
+    The stdlib fallback matches orjson's output: no whitespace and non-ASCII left unescaped.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
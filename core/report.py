@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True)
+class ValidatorReport:
+    """
+    Everything one status message shows for a validator, as produced by process_validator_data.
+    Fields that couldn't be determined hold "N/A".
+    discord.format_status renders it as the Discord message.
+    """
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        "cluster_shorthand", "validator_name", "active_stake_sol", "current_epoch", "epoch_percent_complete",
+        "time_left_in_epoch", "rank", "epoch_credits", "missed_credits", "identity_pubkey", "vote_account_pubkey",
+        "identity_balance_sol", "vote_account_balance_sol", "total_active_stake_sol", "total_delegated_stake_sol",
+        "stake_activating_sol", "stake_deactivating_sol", "net_stake_change_sol", "validator_version", "validator_ip",
+        "leader_slots_total", "leader_slots_completed", "leader_slots_upcoming", "leader_slots_skipped", "leader_skip_rate",
+    )
+
+    cluster_shorthand: str # 'um' or 'ut'
+    validator_name: str # Falls back to the shortened identity pubkey
+    active_stake_sol: float # From the vote account
+    current_epoch: Union[int, str]
+    epoch_percent_complete: float
+    time_left_in_epoch: str
+    rank: Union[int, str]
+    epoch_credits: Union[int, str]
+    missed_credits: Union[int, str] # Relative to the rank 1 validator
+    identity_pubkey: str
+    vote_account_pubkey: str
+    identity_balance_sol: Union[float, str]
+    vote_account_balance_sol: Union[float, str]
+    total_active_stake_sol: float # The stake totals come from 'solana stakes'
+    total_delegated_stake_sol: float
+    stake_activating_sol: float
+    stake_deactivating_sol: float
+    net_stake_change_sol: float
+    validator_version: str
+    validator_ip: str
+    leader_slots_total: int
+    leader_slots_completed: int
+    leader_slots_upcoming: int
+    leader_slots_skipped: int
+    leader_skip_rate: float # Percent of completed leader slots that were skipped
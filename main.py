@@ -1,51 +1,41 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-import os
 import logging
+import logging.config
 
-# Project root is /home/sol/val_discord_status/ (or similar)
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-
-# For `from core.fetch_data...` to work,
-# PROJECT_ROOT itself needs to be in sys.path because 'core' is a directory (package) under it.
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-# Import get_log_level from core.config after potentially adding PROJECT_ROOT to sys.path
-from core.config import get_log_level 
+# Running `python3 main.py` puts this script's directory (the project root) first on sys.path,
+# so the 'core' package next to it is importable without any path manipulation.
+from core.config import get_log_level
 
 # --- Logging Setup ---
 # When run via systemd, logs will go to journald by default if stdout/stderr are journal.
-# This basic config is for console output if run directly and for modules to pick up.
-# Determine log level from config file
-LOG_LEVEL_STR = get_log_level() # Get from config
-LOG_LEVEL = getattr(logging, LOG_LEVEL_STR, logging.INFO) # Convert string to logging level object, default to INFO
-
-logging.basicConfig(
-    level=LOG_LEVEL, # Use level from config
-    format='%(asctime)s - %(levelname)s - %(name)s - %(module)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout) # Ensure logs go to stdout for systemd to capture if needed
-    ]
-)
+# This config is for console output if run directly and for modules to pick up.
+# get_log_level() returns a validated level name (e.g. "INFO"), which dictConfig accepts as is.
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False, # Keep loggers created while importing core.config
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(levelname)s - %(name)s - %(module)s - %(message)s",
+        },
+    },
+    "handlers": {
+        "stdout": {
+            "class": "logging.StreamHandler", # Ensure logs go to stdout for systemd to capture if needed
+            "stream": "ext://sys.stdout",
+            "formatter": "default",
+        },
+    },
+    "root": {
+        "level": get_log_level(), # Use level from config
+        "handlers": ["stdout"],
+    },
+}
+logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 # --- End Logging Setup ---
 
-try:
-    # Now Python can find the 'core' package within PROJECT_ROOT
-    from core.fetch_data import report_validator_status
-    # We need to import get_log_level earlier to set up logging, so no need to re-import here.
-    # from core.config import get_log_level # Already imported above
-except ImportError as e:
-    # If core.config itself fails to import, get_log_level won't be available.
-    # In such critical import failures, logger might not be fully set up with config level.
-    # The initial logger.critical calls will use default logging level until basicConfig is effective.
-    print(f"CRITICAL: Error importing 'report_validator_status' or 'get_log_level': {e}") # Fallback print for very early error
-    print(f"CRITICAL: PROJECT_ROOT: {PROJECT_ROOT}")
-    print(f"CRITICAL: Current sys.path: {sys.path}")
-    sys.exit(1)
-
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Validator Discord Status.") # Updated description
     parser.add_argument(
@@ -55,6 +45,16 @@ if __name__ == '__main__':
         help="Specify which cluster to report ('um' for mainnet, 'ut' for testnet)."
     )
     args = parser.parse_args()
+
+    # Imported only once the arguments are valid, so --help and usage errors exit without
+    # loading requests and the rest of the RPC stack.
+    try:
+        from core.fetch_data import report_validator_status
+    except ImportError as e:
+        # core.config was imported above, so logging is already configured from config.toml here.
+        logger.critical(f"Error importing 'report_validator_status': {e}")
+        logger.critical(f"Current sys.path: {sys.path}")
+        sys.exit(1)
     
     logger.info(f"Validator Discord Status script initiated for cluster: {args.cluster.upper()}") # Changed to logger
     try: